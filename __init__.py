@@ -1,4 +1,3 @@
-import functools
 import itertools
 import operator
 import railroads_hillclimber.prefab as prefab
@@ -32,7 +31,8 @@ def compute_climb(
     The return value is a sequence of pairs, such that for every pair, the
     first element is the train that's making it up the grade and the second
     element is the train that's heading back down. Note that, once the
-    entire train is at the top, the second element will be None.
+    entire train is at the top, the second element will be None. A train
+    that is entirely power climbs in a single trip.
     """
     power_len = prepper.collect_front_len(train, grade, power_ratio)
     power = stock.Train(train[:power_len])
@@ -40,20 +40,20 @@ def compute_climb(
     splits = splitter.compute_split(power, cut, grade,
             power_ratio=power_ratio,
             collect_net=collect_net)
-    subcuts = splitter.split_to_subcuts(cut, splits)
-    subcuts, add_power = itertools.tee(subcuts)
-    add_power = (filter(operator.methodcaller(
-        'can_climb', grade=grade, power_ratio=power_ratio), x)
-        for x in add_power)
-    add_power = (functools.reduce(operator.add, x, stock.Train(()))
-            for x in add_power)
-    trip_power = itertools.accumulate(itertools.chain(
+    subcuts = tuple(splitter.split_to_subcuts(cut, splits))
+    add_power = (stock.Train(
+        unit for unit, force in zip(
+            x, x.unit_net_forces(grade=grade, power_ratio=power_ratio))
+        if force > 0)
+        for x in subcuts)
+    trip_power = tuple(itertools.accumulate(itertools.chain(
         (power,),
-        add_power))
-    up_power, down_power = itertools.tee(trip_power)
-    down_power = itertools.islice(down_power, 1, None)
-    up = map(operator.add, up_power, subcuts)
-    down = down_power
+        add_power)))
+    up = map(operator.add, trip_power, subcuts)
+    down = trip_power[1:]
     trips = list(zip(up, down))
+    if len(trips) == 0:
+        # The whole train is power, so it climbs in a single trip.
+        return [(power, None)]
     trips[-1] = (trips[-1][0], None)
     return trips
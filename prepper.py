@@ -18,12 +18,7 @@ def cluster_forces(
     In each pair, the first element is the length of the subgroup, while the
     second element is the total net force within the subgroup.
     """
-    forces = map(
-            operator.methodcaller(
-                'net_force',
-                grade=grade, 
-                power_ratio=power_ratio),
-            train)
+    forces = train.unit_net_forces(grade=grade, power_ratio=power_ratio)
     groups = map(tuple, map(
         operator.itemgetter(1),
         itertools.groupby(forces, lambda x: x>0)))
@@ -1,6 +1,6 @@
-import functools
+import bisect
 import itertools
-import operator
+import math
 from railroads_hillclimber.stock import Calculative, Train
 from typing import Iterable, Iterator, Sequence, Tuple
 
@@ -16,19 +16,21 @@ def quicksplit(
     """
     splits = []
     assert capacity > 0
-    while len(cut) > 0:
+    n = len(cut)
+    start = 0
+    while start < n:
         remaining_capacity = capacity
-        for take_len, next_force in zip(
-                itertools.count(),
-                itertools.chain(cut, (0.0,))):
-            remaining_capacity += next_force
+        end = start
+        while end < n:
+            remaining_capacity += cut[end]
             if remaining_capacity < 0:
                 break
-        if take_len==0:
+            end += 1
+        if end == start:
             return None
         else:
-            splits.append(take_len)
-            cut = cut[take_len:]
+            splits.append(end - start)
+            start = end
     return tuple(splits)
 
 def fastsplit(
@@ -37,26 +39,33 @@ def fastsplit(
         collect_net: bool = False) -> Tuple[int]:
     """Run the Fastsplit algorithm.
 
-    Worst case O(n²), optimal when cut is strictly nonpositive or when
+    Worst case O(n log n), optimal when cut is strictly nonpositive or when
     collect_net is True.
 
-    capacity -- Amount of head force capacity available.
+    capacity -- Amount of head force capacity available. This may be
+    nonpositive, in which case every subcut must make up the difference.
     cut -- Forces for each unit in the cut.
     collect_net -- If True, when a subcut has a positive force, it is added
     to power for future subcuts.
     """
     splits = []
-    assert capacity > 0
-    while len(cut) > 0:
-        for this_len in range(len(cut), 0, -1):
-            if capacity + sum(cut[:this_len]) > 0:
-                splits.append(this_len)
-                if collect_net:
-                    capacity += sum(x for x in cut[:this_len] if x>0)
-                cut = cut[this_len:]
-                break
-        else:
+    n = len(cut)
+    ps = tuple(itertools.accumulate(cut, initial=0.0))
+    if collect_net:
+        pos_ps = tuple(itertools.accumulate(
+            (x if x>0 else 0.0 for x in cut), initial=0.0))
+    # max_ps[i] is the largest of ps[n-i:], so it is nondecreasing and the
+    # furthest end giving a valid subcut can be found by bisection.
+    max_ps = tuple(itertools.accumulate(reversed(ps), max))
+    start = 0
+    while start < n:
+        end = n - bisect.bisect_right(max_ps, ps[start] - capacity)
+        if end <= start:
             return None
+        splits.append(end - start)
+        if collect_net:
+            capacity += pos_ps[end] - pos_ps[start]
+        start = end
     return tuple(splits)
 
 def smartsplit(
@@ -64,72 +73,40 @@ def smartsplit(
         cut: Sequence[float]) -> Tuple[int]:
     """Run the Smartsplit algorithm.
 
-    Worst case O(n²), optimal in all cases.
+    Strictly O(n²), optimal in all cases.
 
-    capacity -- Amount of head force capacity available.
+    capacity -- Amount of head force capacity available. This may be
+    nonpositive, in which case every subcut must make up the difference.
     cut -- Forces for each unit in the cut.
     """
-    assert capacity > 0
-    cache = [0] * len(cut)
-    # cache[N-1] holds, for the last N cars, either the optimal splits or a
-    # lower bound on the number of splits required. This allows for quickly
-    # resolving tail configurations when backtracking force providers.
-
-    def f(cut, max_parts):
-        if len(cut) == 0:
-            return ()
-        def r(result):
-            if result is not None:
-                cache[len(cut)-1] = result
-            else:
-                cache[len(cut)-1] = max_parts
-            return result
-        cached = cache[len(cut)-1]
-        if isinstance(cached, tuple):
-            if len(cached) <= max_parts:
-                return cached
-            else:
-                return None
-        elif cached >= max_parts:
-            return None
-
-        if max_parts == 1:
-            if capacity + sum(cut) > 0:
-                return r((len(cut),))
-            else:
-                return r(None)
-        else:
-            best_split = None
-            best_split_len = max_parts+1
-            this_len = len(cut)
-            while this_len > 0:
-                this_cut = cut[:this_len]
-                if capacity + sum(this_cut) > 0:
-                    # subcut is valid
-                    split = f(cut[this_len:], best_split_len-2)
-                    if split is not None:
-                        # split is valid
-                        split = (this_len,) + split
-                        if len(split) < best_split_len:
-                            best_split_len = len(split)
-                            if best_split_len == 1:
-                                return r(split)
-                            best_split = split
-                        # Check remove units from subcut to get rid of a force
-                        # provider
-                        for removed in reversed(this_cut):
-                            this_len -= 1
-                            if removed > 0:
-                                break
-                    else:
-                        # split was not valid
-                        this_len -= 1
-                else:
-                    # subcut was not valid
-                    this_len -= 1
-            return r(best_split)
-
-    return f(cut, len(cut))
+    n = len(cut)
+    ps = tuple(itertools.accumulate(cut, initial=0.0))
+    # best[i] holds the fewest number of subcuts needed for cut[i:], and
+    # nxt[i] the end of the first of those subcuts. Every suffix of an optimal
+    # split is itself optimal, so the table is filled in from the back.
+    best = [math.inf] * n + [0]
+    nxt = [n] * (n + 1)
+    for i in range(n-1, -1, -1):
+        base = capacity - ps[i]
+        if base + ps[n] > 0:
+            # The whole suffix fits in one subcut; nothing can beat that.
+            best[i] = 1
+            continue
+        for j in range(n-1, i, -1):
+            if base + ps[j] > 0 and best[j] + 1 < best[i]:
+                best[i] = best[j] + 1
+                nxt[i] = j
+                if best[i] == 2:
+                    # One subcut was ruled out above, so two is optimal.
+                    break
+    if best[0] == math.inf:
+        return None
+    splits = []
+    i = 0
+    while i < n:
+        splits.append(nxt[i] - i)
+        i = nxt[i]
+    return tuple(splits)
 
 def compute_split(
         power: Calculative,
@@ -141,8 +118,10 @@ def compute_split(
     """Compute splits for the given cut such that each subcut can be pulled up
     grade by power.
 
-    The result is guaranteed to use the fewest number of subcuts possible.
-    In the worst case, this will be an O(n²) operation on the train length.
+    The result is guaranteed to use the fewest number of subcuts possible,
+    or is None if no such split exists. An empty cut needs no subcuts, so
+    the result is then (). In the worst case, this will be an O(n²)
+    operation on the train length.
 
     power -- Unit(s) used for the hillclimbing operation.
     cut -- Units that need to be brought up the hill.
@@ -152,11 +131,18 @@ def compute_split(
     that are capable of making the grade under their own power be added to
     the power for future subcuts?
     """
+    if len(cut) == 0:
+        return ()
     p = power.net_force(grade=grade, power_ratio=power_ratio)
-    c = tuple(map(
-        operator.methodcaller('net_force', grade=grade, power_ratio=power_ratio),
-        cut))
-    if max(c) <= 0.0:
+    c = cut.unit_net_forces(grade=grade, power_ratio=power_ratio)
+    if p + sum(c) > 0:
+        # Everything makes it up in a single trip.
+        return (len(cut),)
+    max_c = max(c)
+    if max_c <= 0.0:
+        if p <= 0:
+            # Nothing in the cut can help the power make the grade.
+            return None
         return quicksplit(p, c)
     elif collect_net is True:
         return fastsplit(p, c, collect_net=True)
@@ -165,11 +151,10 @@ def compute_split(
 
 def split_to_slices(split: Iterable[int]) -> Iterator[slice]:
     """Convert a splitting sequence into an iterator of slices."""
-    l1, l2 = itertools.tee(split)
-    e = itertools.accumulate(l2)
-    e1, e2 = itertools.tee(e)
-    s = map(operator.sub, e2, l1)
-    return map(slice, s, e1)
+    start = 0
+    for length in split:
+        yield slice(start, start + length)
+        start += length
 
 def split_to_subcuts(
         cut: Train,
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
 import collections.abc
+import itertools
 import math
-import operator
+
+def _starting_factor(grade):
+    """Starting force per pound of mass on grade."""
+    return (grade + 0.004) / math.sqrt(grade * grade + 1)
 
 class Calculative(ABC):
     """Abstract base class that provides grade-related calculations.
@@ -20,6 +24,8 @@ class Calculative(ABC):
     F = total force (pounds of force)
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def mass(self):
@@ -35,7 +41,7 @@ class Calculative(ABC):
     def starting_force(self, grade):
         """The amount of force needed to move the rolling stock upwards on the
         given grade, in pounds of force."""
-        return self.mass * (grade + 0.004) / math.sqrt(grade * grade + 1)
+        return self.mass * _starting_factor(grade)
 
     def starting_power(self, grade):
         """The percentage of the total tractive effort needed to move the
@@ -47,8 +53,8 @@ class Calculative(ABC):
 
     def spare_capacity(self, grade, power_ratio=1.0):
         """The amount of spare mass capacity on the given grade, in pounds."""
-        return (self.tractive_effort * power_ratio
-                * math.sqrt(grade * grade + 1) / (grade + 0.004) - self.mass)
+        return (self.tractive_effort * power_ratio / _starting_factor(grade)
+                - self.mass)
 
     def maximum_grade(self, power_ratio=1.0):
         """The maximum grade this rolling stock can climb under its own power."""
@@ -79,6 +85,8 @@ class Calculative(ABC):
 class RollingStock(Calculative, ABC):
     """Abstract base class for everything that's treated as rolling stock."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self):
@@ -96,7 +104,7 @@ class RollingStock(Calculative, ABC):
         if isinstance(other, RollingStock):
             return Train((self, other))
         elif isinstance(other, Train):
-            return Train((self,) + tuple(other))
+            return Train(self)._concat(other)
         else:
             return NotImplemented
 
@@ -105,18 +113,20 @@ class RollingStock(Calculative, ABC):
         if isinstance(other, RollingStock):
             return Train((other, self))
         elif isinstance(other, Train):
-            return Train(tuple(other) + (self,))
+            return other._concat(Train(self))
         else:
             return NotImplemented
 
     def __mul__(self, n):
         """Make a Train composed of multiples of this piece of rolling stock."""
-        return Train((self,) * n)
+        return Train._repeat(self, n)
     __rmul__ = __mul__
 
 class Car(RollingStock):
     """Base class for individual pieces of rolling stock."""
 
+    __slots__ = ('_name', '_mass')
+
     def __init__(self, *, name, mass):
         """Create an individual piece of rolling stock.
 
@@ -146,6 +156,8 @@ class TractiveCar(Car):
     effort.
     """
 
+    __slots__ = ('_tractive_effort',)
+
     def __init__(self, name, mass, tractive_effort):
         """Create a piece of rolling stock that applies a tractive effort.
 
@@ -169,6 +181,9 @@ class Train(collections.abc.Sequence, Calculative):
     stock.
     """
 
+    __slots__ = ('_elems', '_flat', '_unit_masses', '_unit_tractive_efforts',
+            '_mass', '_tractive_effort')
+
     def __init__(self, rolling_stock):
         """Create a Train from rolling stock.
 
@@ -186,6 +201,63 @@ class Train(collections.abc.Sequence, Calculative):
             self._elems = (rolling_stock,)
         else:
             self._elems = tuple(rolling_stock)
+        self._flat = tuple(itertools.chain.from_iterable(
+            x.train._flat if isinstance(x, CarGroup) else (x,)
+            for x in self._elems))
+        # Rolling stock is immutable, so per-unit values and totals can be
+        # computed up front and kept alongside the units themselves.
+        self._unit_masses = tuple(x.mass for x in self._elems)
+        self._unit_tractive_efforts = tuple(
+                x.tractive_effort for x in self._elems)
+        self._mass = math.fsum(self._unit_masses)
+        self._tractive_effort = math.fsum(self._unit_tractive_efforts)
+
+    @classmethod
+    def _from_parts(cls, elems, flat, unit_masses, unit_tractive_efforts,
+            mass, tractive_effort):
+        """Create a Train from already-computed per-unit values and totals,
+        skipping the walk over the rolling stock."""
+        train = cls.__new__(cls)
+        train._elems = elems
+        train._flat = flat
+        train._unit_masses = unit_masses
+        train._unit_tractive_efforts = unit_tractive_efforts
+        train._mass = mass
+        train._tractive_effort = tractive_effort
+        return train
+
+    @classmethod
+    def _repeat(cls, unit, n):
+        """Create a Train of n copies of unit, deriving its values from the
+        single unit rather than walking every copy."""
+        elems = (unit,) * n
+        count = len(elems)
+        if isinstance(unit, CarGroup):
+            flat = unit.train._flat * count
+        else:
+            flat = elems
+        mass = unit.mass
+        tractive_effort = unit.tractive_effort
+        return cls._from_parts(
+                elems,
+                flat,
+                (mass,) * count,
+                (tractive_effort,) * count,
+                float(mass * count),
+                float(tractive_effort * count))
+
+    def _concat(self, other):
+        """Join two Trains, reusing the values already computed for both."""
+        unit_masses = self._unit_masses + other._unit_masses
+        unit_tractive_efforts = (self._unit_tractive_efforts
+                + other._unit_tractive_efforts)
+        return Train._from_parts(
+                self._elems + other._elems,
+                self._flat + other._flat,
+                unit_masses,
+                unit_tractive_efforts,
+                math.fsum(unit_masses),
+                math.fsum(unit_tractive_efforts))
 
     def __getitem__(self, x):
         return self._elems[x]
@@ -202,9 +274,9 @@ class Train(collections.abc.Sequence, Calculative):
         other can be either a Train or RollingStock.
         """
         if isinstance(other, RollingStock):
-            return Train(self._elems + (other,))
+            return self._concat(Train(other))
         elif isinstance(other, Train):
-            return Train(self._elems + tuple(other))
+            return self._concat(other)
         else:
             return NotImplemented
 
@@ -214,9 +286,9 @@ class Train(collections.abc.Sequence, Calculative):
         other can be either a Train or RollingStock.
         """
         if isinstance(other, RollingStock):
-            return Train((other,) + self._elems)
+            return Train(other)._concat(self)
         elif isinstance(other, Train):
-            return Train(tuple(other) + self._elems)
+            return other._concat(self)
         else:
             return NotImplemented
 
@@ -226,18 +298,40 @@ class Train(collections.abc.Sequence, Calculative):
         Note this works the same as multiplying e.g. a list or tuple; cars will
         not be grouped together.
         """
-        return Train(self._elems * n)
+        unit_masses = self._unit_masses * n
+        unit_tractive_efforts = self._unit_tractive_efforts * n
+        return Train._from_parts(
+                self._elems * n,
+                self._flat * n,
+                unit_masses,
+                unit_tractive_efforts,
+                math.fsum(unit_masses),
+                math.fsum(unit_tractive_efforts))
     __rmul__ = __mul__
 
     @property
     def mass(self):
         """Total mass of the rolling stock, in pounds."""
-        return sum(map(operator.attrgetter('mass'), self))
+        return self._mass
 
     @property
     def tractive_effort(self):
         """Total tractive effort of the rolling stock, in pounds of force."""
-        return sum(map(operator.attrgetter('tractive_effort'), self))
+        return self._tractive_effort
+
+    def unit_net_forces(self, grade, power_ratio=1.0):
+        """Tuple of the net force of each unit in the train on grade with the
+        provided power setting.
+
+        This is equivalent to calling net_force() on every unit, but only
+        evaluates the grade-dependent terms once.
+        """
+        factor = _starting_factor(grade)
+        return tuple(
+                te * power_ratio - m * factor
+                for m, te in zip(
+                    self._unit_masses,
+                    self._unit_tractive_efforts))
 
     def tractive_units(self):
         """Iterate over units in the train that provide tractive effort."""
@@ -259,11 +353,7 @@ class Train(collections.abc.Sequence, Calculative):
         Note this differs from iter(Train) in that CarGroup instances are
         decomposed here.
         """
-        for x in self:
-            if isinstance(x, CarGroup):
-                yield from x.train
-            else:
-                yield x
+        return iter(self._flat)
 
     def __repr__(self):
         return f'Train({repr(self._elems)})'
@@ -285,6 +375,8 @@ class CarGroup(RollingStock):
     to treat them as a single car (e.g. computing splits for hillclimbing).
     """
 
+    __slots__ = ('_name', '_train')
+
     def __init__(self, name, train):
         """Construct a CarGroup from a Train, iterable, or (generally not
         recommended) single piece of rolling stock.